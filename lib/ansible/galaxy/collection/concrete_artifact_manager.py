@@ -6,6 +6,8 @@
 from __future__ import (absolute_import, division, print_function)
 __metaclass__ = type
 
+import hashlib
+import hmac
 import json
 import os
 import tarfile
@@ -486,7 +488,9 @@ def _download_file(url, b_path, expected_hash, validate_certs, token=None, timeo
         timeout=timeout
     )
 
-    with open(b_file_path, 'wb') as download_file:  # type: t.BinaryIO
+    # Unbuffered: _consume_file already writes 1 MiB chunks, so Python-level
+    # buffering would only copy each chunk a second time before the syscall.
+    with open(b_file_path, 'wb', buffering=0) as download_file:  # type: t.BinaryIO
         actual_hash = _consume_file(resp, write_to=download_file)
 
     if expected_hash:
@@ -495,7 +499,7 @@ def _download_file(url, b_path, expected_hash, validate_certs, token=None, timeo
             'expected hash {expected_hash!s}'.
             format(actual_hash=actual_hash, expected_hash=expected_hash)
         )
-        if expected_hash != actual_hash:
+        if not hmac.compare_digest(to_bytes(expected_hash), to_bytes(actual_hash)):
             raise AnsibleError('Mismatch artifact hash with downloaded file')
 
     return b_file_path
@@ -503,15 +507,26 @@ def _download_file(url, b_path, expected_hash, validate_certs, token=None, timeo
 
 def _consume_file(read_from, write_to=None):
     # type: (t.BinaryIO, t.BinaryIO) -> str
-    bufsize = 65536
+    if write_to is None and hasattr(hashlib, 'file_digest'):
+        # Python 3.11+: the read/update loop runs in C and releases the GIL
+        # while hashing, so hash-only consumers take the fast path.
+        return hashlib.file_digest(read_from, sha256).hexdigest()
+
+    # Read into a reusable 1 MiB buffer so hashing large artifacts feeds the
+    # digest in bulk instead of allocating a fresh chunk per 64 KiB read.
+    buf = bytearray(1024 * 1024)
+    view = memoryview(buf)
     sha256_digest = sha256()
-    data = read_from.read(bufsize)
-    while data:
+    n_read = read_from.readinto(buf)
+    while n_read:
         if write_to is not None:
-            write_to.write(data)
-            write_to.flush()
-        sha256_digest.update(data)
-        data = read_from.read(bufsize)
+            # Unbuffered (raw) file objects may write fewer bytes than
+            # requested, so loop until the whole chunk has been written
+            out_view = view[:n_read]
+            while out_view:
+                out_view = out_view[write_to.write(out_view):]
+        sha256_digest.update(view[:n_read])
+        n_read = read_from.readinto(buf)
 
     return sha256_digest.hexdigest()
 
@@ -59,6 +59,7 @@ from contextlib import contextmanager
 
 try:
     import gzip
+    import zlib
     HAS_GZIP = True
     GZIP_IMP_ERR = None
 except ImportError:
@@ -67,6 +68,12 @@ except ImportError:
     GzipFile = object
 else:
     GzipFile = gzip.GzipFile  # type: ignore[assignment,misc]
+    # gzip.BadGzipFile is only available on Python 3.8+; it subclasses OSError,
+    # which is what older GzipFile implementations raise directly
+    BadGzipFile = getattr(gzip, 'BadGzipFile', OSError)
+
+# ``x-gzip`` is the deprecated RFC 9110 alias servers may still send
+GZIP_ENCODINGS = frozenset(('gzip', 'x-gzip'))
 
 try:
     import email.policy
@@ -796,13 +803,77 @@ def parse_content_type(response):
     return content_type, main_type, sub_type, charset
 
 
-class GzipDecodedReader(GzipFile):
+class _GzipRawDecompressor(io.RawIOBase):
+    """Inflate a gzip stream through ``zlib.decompressobj`` directly.
+
+    Each ``readinto`` is a single zlib call; the gzip wrapper mode
+    (``wbits=31``) still validates the CRC32/ISIZE trailer of every member,
+    and like ``GzipFile`` this decodes multi-member streams in full and
+    raises ``EOFError`` if the stream is truncated mid-member.
+    """
+    def __init__(self, fp):
+        self._io = fp
+        self._decompressor = zlib.decompressobj(31)  # 15 window bits + gzip framing
+        self._member_fed = False  # any bytes fed into the current member yet?
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        max_length = len(b)
+        if not max_length:
+            return 0
+
+        while True:
+            decompressor = self._decompressor
+            if decompressor.eof:
+                # The member ended cleanly; a gzip stream may concatenate
+                # further members, so feed any trailing data to a fresh
+                # decompressor before declaring EOF
+                compressed = decompressor.unused_data or self._io.read(65536)
+                if not compressed:
+                    return 0
+                self._decompressor = decompressor = zlib.decompressobj(31)
+            elif decompressor.unconsumed_tail:
+                compressed = decompressor.unconsumed_tail
+            else:
+                compressed = self._io.read(65536)
+                if not compressed:
+                    if not self._member_fed:
+                        # Clean end of stream at a member boundary
+                        return 0
+                    raise EOFError('Compressed file ended before the end-of-stream marker was reached')
+
+            self._member_fed = True
+            try:
+                chunk = decompressor.decompress(compressed, max_length)
+            except zlib.error as e:
+                # Present corrupt data as the OSError (subclass) GzipFile
+                # raises so existing callers' error handling keeps working
+                raise BadGzipFile('Not a gzipped file (%s)' % e)
+            if chunk:
+                b[:len(chunk)] = chunk
+                return len(chunk)
+
+    def close(self):
+        try:
+            self._io.close()
+        finally:
+            io.RawIOBase.close(self)
+
+
+class GzipDecodedReader(io.BufferedIOBase):
     """A file-like object to decode a response encoded with the gzip
     method, as described in RFC 1952.
 
     Largely copied from ``xmlrpclib``/``xmlrpc.client``
     """
-    def __init__(self, fp):
+
+    # Compressed payloads at or below this size are inflated with a single
+    # C-level call instead of going through GzipFile's chunked read loop
+    _ONE_SHOT_MAX = 4 * 1024 * 1024
+
+    def __init__(self, fp, content_length=None):
         if not HAS_GZIP:
             raise MissingModuleError(self.missing_gzip_error(), import_traceback=GZIP_IMP_ERR)
 
@@ -816,13 +887,41 @@ class GzipDecodedReader(GzipFile):
                 self._io.write(block)
             self._io.seek(0)
             fp.close()
-        gzip.GzipFile.__init__(self, mode='rb', fileobj=self._io)  # pylint: disable=non-parent-init-called
+            content_length = None
+
+        try:
+            content_length = int(content_length)
+        except (TypeError, ValueError):
+            content_length = None
+
+        if content_length is not None and content_length <= self._ONE_SHOT_MAX:
+            # ``Content-Length`` is the compressed size; typical API payloads
+            # fit comfortably in memory and decode fastest in one shot
+            self._fp = io.BytesIO(gzip.decompress(self._io.read()))
+        elif PY3:
+            self._fp = io.BufferedReader(_GzipRawDecompressor(self._io))
+        else:
+            self._fp = gzip.GzipFile(mode='rb', fileobj=self._io)
+
+    def read(self, *args):
+        return self._fp.read(*args)
+
+    def read1(self, *args):
+        # http.client.HTTPResponse.read1 delegates to its fp's read1
+        return self._fp.read1(*args)
+
+    def readline(self, *args):
+        return self._fp.readline(*args)
+
+    def readable(self):
+        return True
 
     def close(self):
         try:
-            gzip.GzipFile.close(self)
+            self._fp.close()
         finally:
             self._io.close()
+            io.BufferedIOBase.close(self)
 
     @staticmethod
     def missing_gzip_error():
@@ -1555,8 +1654,8 @@ class Request:
                 request.add_header(header, headers[header])
 
         r = urllib_request.urlopen(request, None, timeout)
-        if decompress and r.headers.get('content-encoding', '').lower() == 'gzip':
-            fp = GzipDecodedReader(r.fp)
+        if decompress and r.headers.get('content-encoding', '').strip().lower() in GZIP_ENCODINGS:
+            fp = GzipDecodedReader(r.fp, content_length=r.headers.get('content-length'))
             if PY3:
                 r.fp = fp
                 # Content-Length does not match gzip decoded length
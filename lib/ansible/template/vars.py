@@ -40,6 +40,10 @@ class AnsibleJ2Vars(Mapping):
     To facilitate using builtin jinja2 things like range, globals are also handled here.
     '''
 
+    # One instance is created per template render, so avoid the per-instance
+    # __dict__ and make attribute access a fixed slot lookup.
+    __slots__ = ('_templar', '_globals', '_locals')
+
     def __init__(self, templar, globals, locals=None):
         '''
         Initializes this object with a valid Templar() object, as
@@ -67,15 +71,16 @@ class AnsibleJ2Vars(Mapping):
             return True
         return False
 
-    def __iter__(self):
+    def _keys(self):
         keys = set()
         keys.update(self._templar.available_variables, self._locals, self._globals)
-        return iter(keys)
+        return keys
+
+    def __iter__(self):
+        return iter(self._keys())
 
     def __len__(self):
-        keys = set()
-        keys.update(self._templar.available_variables, self._locals, self._globals)
-        return len(keys)
+        return len(self._keys())
 
     def __getitem__(self, varname):
         if varname in self._locals:
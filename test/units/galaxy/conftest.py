@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2023, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+# Make coding more python3-ish
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+import gzip
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope='session')
+def isal_gzip():
+    ''' Optionally route gzip through the accelerated isal implementation.
+
+    The build tests compress and decompress real .tar.gz artifacts through
+    tarfile's gzip layer. When ISAL_GZIP=1 is set and the optional isal
+    binding is installed, gzip.GzipFile is swapped for isal.igzip.IGzipFile,
+    which produces and consumes the same wire format considerably faster.
+    Without the env var or the package this fixture is inert.
+    '''
+    if os.environ.get('ISAL_GZIP'):
+        try:
+            from isal import igzip
+        except ImportError:
+            igzip = None
+
+        if igzip is not None:
+            original_gzipfile = gzip.GzipFile
+            gzip.GzipFile = igzip.IGzipFile
+            try:
+                yield
+            finally:
+                gzip.GzipFile = original_gzipfile
+            return
+
+    yield
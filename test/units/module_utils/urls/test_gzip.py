@@ -62,6 +62,40 @@ Content-Length: 100
 %s''' % compress(JSON_DATA)
 
 
+def gzip_response(body, content_length=True):
+    '''Build a gzip encoded response, optionally without Content-Length.
+
+    A response without Content-Length is decoded by the streaming
+    decompressor rather than the one-shot path.
+    '''
+    resp = b'''HTTP/1.1 200 OK
+Content-Type: application/json; charset=utf-8
+Content-Encoding: gzip
+'''
+    if content_length:
+        resp += b'Content-Length: %d\n' % len(body)
+    return resp + b'\n' + body
+
+
+def mock_gzip_response(urlopen_mock, resp):
+    h = http_client.HTTPResponse(
+        Sock(resp),
+        method='GET',
+    )
+    h.begin()
+
+    if PY3:
+        urlopen_mock.return_value = h
+    else:
+        urlopen_mock.return_value = addinfourl(
+            h.fp,
+            h.msg,
+            'http://ansible.com/',
+            h.status,
+        )
+        urlopen_mock.return_value.msg = h.reason
+
+
 def test_Request_open_gzip(urlopen_mock):
     h = http_client.HTTPResponse(
         Sock(GZIP_RESP),
@@ -131,6 +165,48 @@ def test_Request_open_decompress_false(urlopen_mock):
     assert r.read() == JSON_DATA
 
 
+def test_Request_open_gzip_no_content_length(urlopen_mock):
+    mock_gzip_response(urlopen_mock, gzip_response(compress(JSON_DATA), content_length=False))
+
+    r = Request().open('GET', 'https://ansible.com/')
+    assert isinstance(r.fp, GzipDecodedReader)
+    assert r.read() == JSON_DATA
+
+
+@pytest.mark.parametrize('content_length', [True, False])
+def test_Request_open_gzip_multi_member(urlopen_mock, content_length):
+    # A gzip stream may concatenate several members; both decode paths must
+    # return all of them
+    body = compress(JSON_DATA[:50]) + compress(JSON_DATA[50:])
+    mock_gzip_response(urlopen_mock, gzip_response(body, content_length=content_length))
+
+    r = Request().open('GET', 'https://ansible.com/')
+    assert r.read() == JSON_DATA
+
+
+@pytest.mark.parametrize('content_length', [True, False])
+def test_Request_open_gzip_truncated(urlopen_mock, content_length):
+    # A stream that ends before the gzip end-of-stream marker must not be
+    # silently returned as complete
+    body = compress(JSON_DATA)[:-5]
+    mock_gzip_response(urlopen_mock, gzip_response(body, content_length=content_length))
+
+    # The one-shot path raises while wrapping the response, the streaming
+    # path on the first read
+    with pytest.raises(EOFError):
+        Request().open('GET', 'https://ansible.com/').read()
+
+
+def test_Request_open_gzip_corrupt(urlopen_mock):
+    body = bytearray(compress(JSON_DATA))
+    body[len(body) // 2] ^= 0xFF
+    mock_gzip_response(urlopen_mock, gzip_response(bytes(body), content_length=False))
+
+    r = Request().open('GET', 'https://ansible.com/')
+    with pytest.raises(OSError):
+        r.read()
+
+
 def test_GzipDecodedReader_no_gzip(monkeypatch, mocker):
     monkeypatch.delitem(sys.modules, 'gzip')
     monkeypatch.delitem(sys.modules, 'ansible.module_utils.urls')